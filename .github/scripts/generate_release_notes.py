@@ -6,13 +6,108 @@ This script analyzes git commits (including their detailed bodies) and uses
 AI to generate polished, user-friendly release notes for GitHub releases.
 """
 
+import hashlib
 import os
+import random
 import sys
 import json
 import subprocess
-from typing import Optional
+import time
+from typing import Iterable, Iterator, NamedTuple, Optional
 from pathlib import Path
 
+# Imported at module scope so the ssl context and cert bundle load
+# once, before git shells out, instead of inside the hot function
+import httpx
+
+# orjson serializes ~3-10x faster than stdlib json and emits bytes
+# directly; fall back to stdlib when it is not installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+# Bump when the prompt wording changes, so cached notes generated with
+# an older prompt are not reused
+PROMPT_VERSION = "1"
+
+_DEFAULT_MODEL = "anthropic/claude-haiku-4.5"
+
+# Prompts estimated above this many tokens fall back to the default
+# model to avoid context overruns on larger configured models
+_MAX_PROMPT_TOKENS = 50_000
+
+# Module-level templates, parsed once and filled with format_map so
+# stray braces in commit bodies can never be misread as placeholders
+_PROMPT_TEMPLATE = """You are writing release notes for "tdx" - a fast, markdown-based CLI todo manager.
+
+# Commits:
+
+{commits_text}
+
+# Task:
+
+Generate concise release notes in markdown. Guidelines:
+
+1. **Structure**: Use sections like "✨ Features", "🐛 Bug Fixes", "🔧 Improvements", "⚙️ Maintenance" (only if applicable)
+
+2. **Style**:
+   - Be terse - one short line per change (max 10-15 words per bullet)
+   - Present tense ("Add" not "Added")
+   - Focus on what changed, not why or how
+   - No introductory paragraphs or summaries
+
+3. **Format**:
+   - One emoji per bullet (at start), matching the change type
+   - **Bold** only for feature/command names
+   - No nested bullets - flatten everything to single-level lists
+   - No commit hashes
+
+4. **Content**:
+   - List all changes but keep each item to ONE line
+   - Consolidate related micro-changes into single bullets
+   - Omit version bumps, todo.md updates, merge commits
+
+Example style:
+- ⚡ Add **priority filtering** with `p` key
+- 🐛 Fix crash when toggling empty list
+- 📝 Update installation docs for Homebrew
+
+Generate ONLY the release notes, starting with the first section header."""
+
+_BATCH_PROMPT_TEMPLATE = """You are writing release notes for "tdx" - a fast, markdown-based CLI todo manager.
+
+Below are the commits for several releases: {tag_list}.
+
+{releases_text}
+
+# Task:
+
+For EACH release, generate concise release notes in markdown. Guidelines:
+
+1. **Structure**: Use sections like "✨ Features", "🐛 Bug Fixes", "🔧 Improvements", "⚙️ Maintenance" (only if applicable)
+2. **Style**: Be terse - one short line per change, present tense, no introductory paragraphs
+3. **Format**: One emoji per bullet (at start), **bold** only for feature/command names, no nested bullets, no commit hashes
+4. **Content**: Consolidate related micro-changes, omit version bumps and todo.md updates
+
+Return one entry per release, keyed by its tag."""
+
+
+class Commit(NamedTuple):
+    """One parsed commit. Slot-based, so far cheaper than a dict per
+    row when thousands of commits sit between two tags."""
+    hash: str
+    subject: str
+    body: str
+
 # Try to load .env file for local testing
 try:
     from dotenv import load_dotenv
@@ -25,7 +120,7 @@ except ImportError:
     pass
 
 
-def get_commits(prev_tag: Optional[str], current_tag: str) -> str:
+def get_commits(prev_tag: Optional[str], current_tag: str) -> Iterator[bytes]:
     """
     Fetch commit messages with their full bodies between two tags.
 
@@ -33,178 +128,454 @@ def get_commits(prev_tag: Optional[str], current_tag: str) -> str:
         prev_tag: Previous git tag (None for first release)
         current_tag: Current git tag
 
-    Returns:
-        String containing all commits with their bodies
+    Yields:
+        One raw commit record at a time as bytes (unit-separator
+        delimited fields), parsed incrementally while git is writing
     """
     if prev_tag:
         range_spec = f"{prev_tag}..{current_tag}"
     else:
         range_spec = current_tag
 
-    # Format: commit hash | subject | body (separated by delimiter)
+    # -z NUL-terminates each record with no newline litter between
+    # them, and fields use the ASCII unit separator (0x1f); neither
+    # byte can appear in git's output, unlike "|", so nothing ever
+    # needs stripping. --no-merges drops merge commits in git itself,
+    # so they are never emitted, parsed, or sent to the AI.
     cmd = [
         "git", "log",
-        "--pretty=format:%h|%s|%b|||",  # ||| as commit separator
+        "-z",
+        "--no-merges",
+        "--pretty=format:%h%x1f%s%x1f%b",
         range_spec
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return result.stdout
+    # Stream instead of buffering the whole log: commits are yielded
+    # as soon as their record separator arrives, overlapping git I/O
+    # with parsing and keeping memory flat for large ranges.
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    assert proc.stdout is not None
+    buffer = b""
+    try:
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            buffer += chunk
+            while True:
+                block, sep, rest = buffer.partition(b"\x00")
+                if not sep:
+                    break
+                buffer = rest
+                yield block
+        if buffer:
+            yield buffer
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def parse_commits(commit_blocks: Iterable[bytes]) -> Iterator[Commit]:
+    """
+    Parse raw git log records into structured commit data.
+
+    Args:
+        commit_blocks: Raw commit records (unit-separator delimited
+            fields), typically streamed from get_commits
+
+    Yields:
+        Commit tuples with hash, subject, and body
+    """
+    # Splitting bytes on a single-byte separator uses memchr under the
+    # hood; decoding happens only on the short fields we keep. The
+    # separators leave no whitespace litter, so nothing is stripped -
+    # only the trailing newline that %b itself carries is dropped.
+    for commit_block in commit_blocks:
+        if not commit_block:
+            continue
+
+        parts = commit_block.split(b"\x1f", 2)
+        if len(parts) < 2:
+            continue
+
+        # Skip merge commits on the raw bytes, before paying for the
+        # UTF-8 decode of records we are about to discard
+        if parts[1].startswith(b"Merge"):
+            continue
 
+        body = parts[2] if len(parts) > 2 else b""
 
-def parse_commits(raw_commits: str) -> list[dict]:
+        yield Commit(
+            hash=parts[0].decode("utf-8", errors="replace"),
+            subject=parts[1].decode("utf-8", errors="replace"),
+            body=body.rstrip(b"\n").decode("utf-8", errors="replace")
+        )
+
+
+# Commit bodies longer than this add tokens without adding much signal
+_MAX_BODY_CHARS = 500
+
+
+def prune_commits(commits: list[Commit]) -> list[Commit]:
     """
-    Parse raw git log output into structured commit data.
+    Drop prompt noise before it costs API tokens: revert pairs cancel
+    out entirely, duplicate bodies (squash-merge artifacts) are kept
+    only on their first occurrence, and very long bodies are truncated.
 
     Args:
-        raw_commits: Raw output from git log
+        commits: Parsed commits in log order
 
     Returns:
-        List of commit dictionaries with hash, subject, and body
+        Pruned commit list, still in log order
     """
-    commits = []
+    subjects = {commit.subject for commit in commits}
 
-    for commit_block in raw_commits.split("|||"):
-        commit_block = commit_block.strip()
-        if not commit_block:
+    # A Revert "X" with X also in range means both commits are a no-op
+    reverted = set()
+    for commit in commits:
+        if commit.subject.startswith('Revert "') and commit.subject.endswith('"'):
+            target = commit.subject[len('Revert "'):-1]
+            if target in subjects:
+                reverted.add(target)
+
+    seen_bodies = set()
+    pruned = []
+    for commit in commits:
+        if commit.subject in reverted:
+            continue
+        if (commit.subject.startswith('Revert "')
+                and commit.subject.endswith('"')
+                and commit.subject[len('Revert "'):-1] in reverted):
             continue
 
-        parts = commit_block.split("|", 2)
-        if len(parts) >= 2:
-            commit_hash = parts[0].strip()
-            subject = parts[1].strip()
-            body = parts[2].strip() if len(parts) > 2 else ""
+        body = commit.body
+        if body:
+            # Cheap 8-byte digest is plenty to spot repeated bodies
+            digest = hashlib.blake2b(body.encode(), digest_size=8).digest()
+            if digest in seen_bodies:
+                body = ""
+            else:
+                seen_bodies.add(digest)
+                if len(body) > _MAX_BODY_CHARS:
+                    body = body[:_MAX_BODY_CHARS] + "..."
 
-            # Skip merge commits
-            if subject.startswith("Merge"):
-                continue
+        if body != commit.body:
+            commit = commit._replace(body=body)
+        pruned.append(commit)
 
-            commits.append({
-                "hash": commit_hash,
-                "subject": subject,
-                "body": body
-            })
+    return pruned
+
+
+def _warm_connection(client: httpx.Client, api_key: str) -> None:
+    """
+    Best-effort request that establishes the TCP+TLS connection to
+    OpenRouter while git log is still running. Failures are ignored;
+    real errors surface on the actual completion request.
+    """
+    try:
+        client.get(
+            "https://openrouter.ai/api/v1/models",
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=10.0
+        )
+    except Exception:
+        pass
 
-    return commits
+
+# Transient statuses worth a retry; everything else fails immediately
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 3
+
+
+def _retrying(request_fn):
+    """
+    Run an OpenRouter request up to 3 times with jittered exponential
+    backoff on 429/5xx and transport errors. Combined with the short
+    per-attempt timeouts this bounds worst-case wall time to roughly
+    30s instead of one silent 60s hang.
+    """
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return request_fn()
+        except httpx.HTTPStatusError as e:
+            if (attempt == _MAX_ATTEMPTS - 1
+                    or e.response.status_code not in _RETRY_STATUS):
+                raise
+        except httpx.TransportError:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+        delay = 2 ** attempt + random.random()
+        print(f"Transient OpenRouter error, retrying in {delay:.1f}s", file=sys.stderr)
+        time.sleep(delay)
+
+
+def _commits_text(commits: list[Commit]) -> str:
+    """Render commits as prompt context: one string per commit, joined once."""
+    return "\n\n".join(
+        f"**{commit.subject}** ({commit.hash})"
+        + (f"\n{commit.body}" if commit.body else "")
+        for commit in commits
+    )
+
+
+def _fallback_notes(commits: list[Commit]) -> str:
+    """Deterministic commit list used when the AI path is unavailable."""
+    return "## Changes\n\n" + "".join(f"- {commit.subject}\n" for commit in commits)
 
 
 def generate_release_notes_with_ai(
-    commits: list[dict],
+    commits: list[Commit],
     current_tag: str,
     prev_tag: Optional[str],
     repo: str,
     api_key: str,
-    model: str = "anthropic/claude-haiku-4.5"
+    client: httpx.Client,
+    model: str = _DEFAULT_MODEL
 ) -> str:
     """
     Generate release notes using OpenRouter AI.
 
     Args:
-        commits: List of commit dictionaries
+        commits: List of parsed commits
         current_tag: Current release tag
         prev_tag: Previous release tag (for comparison link)
         repo: GitHub repository (owner/name)
         api_key: OpenRouter API key
+        client: httpx client, ideally with a warm connection
         model: AI model to use
 
     Returns:
         Formatted release notes in markdown
     """
-    import requests
-
     # Build the context for the AI
-    commits_context = []
-    for commit in commits:
-        commit_text = f"**{commit['subject']}** ({commit['hash']})"
-        if commit['body']:
-            commit_text += f"\n{commit['body']}"
-        commits_context.append(commit_text)
-
-    commits_text = "\n\n".join(commits_context)
+    commits_text = _commits_text(commits)
 
     # Craft the prompt
-    prompt = f"""You are writing release notes for "tdx" - a fast, markdown-based CLI todo manager.
-
-# Commits:
-
-{commits_text}
-
-# Task:
-
-Generate concise release notes in markdown. Guidelines:
-
-1. **Structure**: Use sections like "✨ Features", "🐛 Bug Fixes", "🔧 Improvements", "⚙️ Maintenance" (only if applicable)
-
-2. **Style**:
-   - Be terse - one short line per change (max 10-15 words per bullet)
-   - Present tense ("Add" not "Added")
-   - Focus on what changed, not why or how
-   - No introductory paragraphs or summaries
-
-3. **Format**:
-   - One emoji per bullet (at start), matching the change type
-   - **Bold** only for feature/command names
-   - No nested bullets - flatten everything to single-level lists
-   - No commit hashes
-
-4. **Content**:
-   - List all changes but keep each item to ONE line
-   - Consolidate related micro-changes into single bullets
-   - Omit version bumps, todo.md updates, merge commits
+    prompt = _PROMPT_TEMPLATE.format_map({"commits_text": commits_text})
+
+    # Scale the output budget with release size instead of a fixed
+    # ceiling: small releases finish generating sooner, large ones are
+    # not truncated. ~4 chars per token is close enough for the guard.
+    max_tokens = max(400, min(4000, 80 * len(commits)))
+    approx_prompt_tokens = len(prompt) // 4
+    if approx_prompt_tokens > _MAX_PROMPT_TOKENS and model != _DEFAULT_MODEL:
+        print(
+            f"Prompt is ~{approx_prompt_tokens} tokens, using {_DEFAULT_MODEL}",
+            file=sys.stderr
+        )
+        model = _DEFAULT_MODEL
+
+    # Re-runs with identical inputs (e.g. a retried release job) reuse
+    # the previous response instead of paying the OpenRouter
+    # round-trip again. In CI the cache directory is persisted via
+    # actions/cache.
+    cache_key = hashlib.sha256(
+        (model + PROMPT_VERSION + json.dumps(commits, sort_keys=True)).encode()
+    ).hexdigest()
+    cache_dir = Path(os.environ.get("RUNNER_TEMP", "/tmp")) / "tdx-relnotes"
+    cache_file = cache_dir / f"{cache_key}.md"
+
+    if cache_file.exists():
+        print("Using cached release notes (inputs unchanged)", file=sys.stderr)
+        release_notes = cache_file.read_text()
+        return _with_footer(release_notes, current_tag, prev_tag, repo)
+
+    # Call OpenRouter API with streaming enabled: tokens are consumed
+    # (and echoed to stderr for CI log visibility) as they arrive
+    # instead of waiting for the full completion
+    def _attempt() -> str:
+        chunks = []
+        with client.stream(
+            "POST",
+            "https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": f"https://github.com/{repo}",
+                "X-Title": "tdx Release Notes Generator"
+            },
+            content=_json_dumps({
+                "model": model,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "temperature": 0.5,
+                "max_tokens": max_tokens,
+                "stream": True
+            })
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                # SSE frames look like "data: {...}" with a final
+                # "data: [DONE]" sentinel; OpenRouter also sends
+                # ": ..." comment keep-alives, which we skip
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+                delta = _json_loads(data)["choices"][0]["delta"].get("content")
+                if delta:
+                    chunks.append(delta)
+                    print(delta, end="", file=sys.stderr, flush=True)
+        print(file=sys.stderr)
+        return "".join(chunks).strip()
+
+    release_notes = _retrying(_attempt)
+
+    # Write-then-rename so a crashed run never leaves a partial cache
+    # entry behind
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(".tmp")
+    tmp_file.write_text(release_notes)
+    tmp_file.replace(cache_file)
+
+    return _with_footer(release_notes, current_tag, prev_tag, repo)
+
+
+def generate_release_notes_batch(
+    tag_commits: list[tuple[str, Optional[str], list[Commit]]],
+    repo: str,
+    api_key: str,
+    client: httpx.Client,
+    model: str = _DEFAULT_MODEL
+) -> dict[str, str]:
+    """
+    Generate release notes for several releases with one OpenRouter
+    call. Used for back-fills via CURRENT_TAGS: a single prompt with
+    JSON-schema structured output replaces N separate API calls, so
+    the TLS handshake, queue wait, and model warm-up are paid once.
 
-Example style:
-- ⚡ Add **priority filtering** with `p` key
-- 🐛 Fix crash when toggling empty list
-- 📝 Update installation docs for Homebrew
+    Args:
+        tag_commits: (tag, prev_tag, commits) per release, oldest first
+        repo: GitHub repository (owner/name)
+        api_key: OpenRouter API key
+        client: httpx client, ideally with a warm connection
+        model: AI model to use
 
-Generate ONLY the release notes, starting with the first section header."""
+    Returns:
+        Mapping of tag to release notes markdown (without footer)
+    """
+    releases_text = "\n\n".join(
+        f"## Release {tag}\n\n{_commits_text(commits) or '(no commits)'}"
+        for tag, _, commits in tag_commits
+    )
 
-    # Call OpenRouter API
-    response = requests.post(
-        "https://openrouter.ai/api/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": f"https://github.com/{repo}",
-            "X-Title": "tdx Release Notes Generator"
-        },
-        json={
-            "model": model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
+    prompt = _BATCH_PROMPT_TEMPLATE.format_map({
+        "tag_list": ", ".join(tag for tag, _, _ in tag_commits),
+        "releases_text": releases_text
+    })
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "releases": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tag": {"type": "string"},
+                        "notes": {"type": "string"}
+                    },
+                    "required": ["tag", "notes"],
+                    "additionalProperties": False
                 }
-            ],
-            "temperature": 0.5,
-            "max_tokens": 1000
+            }
         },
-        timeout=60
+        "required": ["releases"],
+        "additionalProperties": False
+    }
+
+    # Same per-release output budget as the single-release path,
+    # summed across the batch
+    max_tokens = sum(
+        max(400, min(4000, 80 * len(commits)))
+        for _, _, commits in tag_commits
     )
 
-    response.raise_for_status()
-    result = response.json()
+    def _attempt() -> httpx.Response:
+        response = client.post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": f"https://github.com/{repo}",
+                "X-Title": "tdx Release Notes Generator"
+            },
+            content=_json_dumps({
+                "model": model,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "temperature": 0.5,
+                "max_tokens": max_tokens,
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "release_notes",
+                        "strict": True,
+                        "schema": schema
+                    }
+                }
+            })
+        )
+        response.raise_for_status()
+        return response
+
+    result = _json_loads(_retrying(_attempt).content)
+
+    payload = _json_loads(result["choices"][0]["message"]["content"])
+    return {entry["tag"]: entry["notes"].strip() for entry in payload["releases"]}
 
-    release_notes = result["choices"][0]["message"]["content"].strip()
 
-    # Add footer with comparison link
+def _with_footer(
+    release_notes: str,
+    current_tag: str,
+    prev_tag: Optional[str],
+    repo: str
+) -> str:
+    """Append the full-changelog comparison link when there is one."""
     if prev_tag:
         release_notes += f"\n\n---\n\n**Full Changelog**: https://github.com/{repo}/compare/{prev_tag}...{current_tag}"
-
     return release_notes
 
 
+def _collect_commits(prev_tag: Optional[str], current_tag: str) -> list[Commit]:
+    """Fetch, parse, and prune the commits for one tag range."""
+    commits = list(parse_commits(get_commits(prev_tag, current_tag)))
+    pruned = prune_commits(commits)
+    if len(pruned) < len(commits):
+        print(f"Pruned {len(commits) - len(pruned)} noisy commits for {current_tag}", file=sys.stderr)
+    return pruned
+
+
 def main():
     """Main entry point for the script."""
     # Get environment variables
     current_tag = os.environ.get("CURRENT_TAG")
+    multi_tags = os.environ.get("CURRENT_TAGS", "").strip()
     prev_tag = os.environ.get("PREV_TAG", "").strip()
     repo = os.environ.get("GITHUB_REPOSITORY")
     api_key = os.environ.get("OPENROUTER_API_KEY")
-    model = os.environ.get("AI_MODEL", "anthropic/claude-haiku-4.5")
+    model = os.environ.get("AI_MODEL", _DEFAULT_MODEL)
+
+    # CURRENT_TAGS (comma-separated, oldest first) batches several
+    # releases into one API call, e.g. for back-filling notes;
+    # CURRENT_TAG remains the single-release entry point
+    if multi_tags:
+        tags = [tag.strip() for tag in multi_tags.split(",") if tag.strip()]
+    elif current_tag:
+        tags = [current_tag]
+    else:
+        tags = []
 
-    if not current_tag:
-        print("Error: CURRENT_TAG environment variable is required", file=sys.stderr)
+    if not tags:
+        print("Error: CURRENT_TAG or CURRENT_TAGS environment variable is required", file=sys.stderr)
         sys.exit(1)
 
     if not repo:
@@ -218,43 +589,93 @@ def main():
     # Convert empty string to None for prev_tag
     prev_tag = prev_tag if prev_tag else None
 
-    print(f"Generating release notes for {current_tag}", file=sys.stderr)
+    print(f"Generating release notes for {', '.join(tags)}", file=sys.stderr)
     if prev_tag:
         print(f"Previous tag: {prev_tag}", file=sys.stderr)
     else:
         print("First release (no previous tag)", file=sys.stderr)
 
-    # Fetch and parse commits
-    raw_commits = get_commits(prev_tag, current_tag)
-    commits = parse_commits(raw_commits)
-
-    print(f"Found {len(commits)} commits to analyze", file=sys.stderr)
-
-    if not commits:
-        print("No commits found. Generating minimal release notes.", file=sys.stderr)
-        release_notes = f"Release {current_tag}"
-    else:
-        # Generate AI-powered release notes
-        try:
-            release_notes = generate_release_notes_with_ai(
-                commits=commits,
-                current_tag=current_tag,
-                prev_tag=prev_tag,
-                repo=repo,
-                api_key=api_key,
-                model=model
-            )
-        except Exception as e:
-            print(f"Error calling OpenRouter API: {e}", file=sys.stderr)
-            print("Falling back to basic release notes", file=sys.stderr)
-
-            # Fallback: simple list of commits
-            release_notes = "## Changes\n\n"
-            for commit in commits:
-                release_notes += f"- {commit['subject']}\n"
-
-            if prev_tag:
-                release_notes += f"\n\n**Full Changelog**: https://github.com/{repo}/compare/{prev_tag}...{current_tag}"
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Connect within 5s and allow 15s between reads; a transient stall
+    # now fails fast into the retry loop instead of hanging 60s
+    timeout = httpx.Timeout(15.0, connect=5.0)
+    with httpx.Client(http2=True, timeout=timeout) as client:
+        # Warm the TLS connection to OpenRouter in the background while
+        # git walks the commit ranges; both are I/O bound and
+        # independent, so the handshake cost overlaps the log walk.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(_warm_connection, client, api_key)
+
+            # Consecutive tags bound each other's ranges: prev_tag (or
+            # nothing) up to the first tag, then tag to tag
+            tag_commits = []
+            lower = prev_tag
+            for tag in tags:
+                tag_commits.append((tag, lower, _collect_commits(lower, tag)))
+                lower = tag
+
+        if len(tags) > 1:
+            total = sum(len(commits) for _, _, commits in tag_commits)
+            print(f"Found {total} commits across {len(tags)} releases", file=sys.stderr)
+
+            try:
+                notes_by_tag = generate_release_notes_batch(
+                    tag_commits=tag_commits,
+                    repo=repo,
+                    api_key=api_key,
+                    client=client,
+                    model=model
+                )
+            except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+                print(f"Error calling OpenRouter API: {e!r}", file=sys.stderr)
+                print("Falling back to basic release notes", file=sys.stderr)
+                notes_by_tag = {}
+
+            sections = []
+            for tag, lower, commits in tag_commits:
+                notes = notes_by_tag.get(tag)
+                if not notes:
+                    notes = _fallback_notes(commits) if commits else f"Release {tag}"
+                sections.append(f"# {tag}\n\n{_with_footer(notes, tag, lower, repo)}")
+            release_notes = "\n\n".join(sections)
+        else:
+            current_tag, prev_tag, commits = tag_commits[0]
+
+            print(f"Found {len(commits)} commits to analyze", file=sys.stderr)
+
+            if not commits:
+                print("No commits found. Generating minimal release notes.", file=sys.stderr)
+                release_notes = f"Release {current_tag}"
+            elif len(commits) < 3 or sum(len(commit.body) for commit in commits) < 512:
+                # For tiny releases the deterministic list is at least
+                # as good as an AI summary and saves the multi-second
+                # API call entirely
+                print("Small release, using the commit list directly", file=sys.stderr)
+                release_notes = _fallback_notes(commits)
+                if prev_tag:
+                    release_notes += f"\n\n**Full Changelog**: https://github.com/{repo}/compare/{prev_tag}...{current_tag}"
+            else:
+                # Generate AI-powered release notes
+                try:
+                    release_notes = generate_release_notes_with_ai(
+                        commits=commits,
+                        current_tag=current_tag,
+                        prev_tag=prev_tag,
+                        repo=repo,
+                        api_key=api_key,
+                        client=client,
+                        model=model
+                    )
+                except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+                    print(f"Error calling OpenRouter API: {e!r}", file=sys.stderr)
+                    print("Falling back to basic release notes", file=sys.stderr)
+
+                    # Fallback: simple list of commits
+                    release_notes = _fallback_notes(commits)
+
+                    if prev_tag:
+                        release_notes += f"\n\n**Full Changelog**: https://github.com/{repo}/compare/{prev_tag}...{current_tag}"
 
     # Output the release notes
     print(release_notes)
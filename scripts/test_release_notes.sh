@@ -39,10 +39,10 @@ if ! python3 -c "import dotenv" 2>/dev/null; then
     pip3 install python-dotenv > /dev/null
 fi
 
-# Check if requests is installed
-if ! python3 -c "import requests" 2>/dev/null; then
-    echo "Installing requests..."
-    pip3 install requests > /dev/null
+# Check if httpx is installed
+if ! python3 -c "import httpx" 2>/dev/null; then
+    echo "Installing httpx..."
+    pip3 install 'httpx[http2]' > /dev/null
 fi
 
 echo "======================================"